@@ -8,7 +8,7 @@ Full click path per applicant:
   â [Profile] click "Applications" in sidebar â click application row ">"
   â [Application] click "ATTACHMENTS" tab
   â click "APPLICATION PDF" section to expand
-  â click PDF.js Save/Download button
+  â fetch the PDF the viewer loads (PDF.js Save/Download button as fallback)
   â file saved to DOWNLOAD_DIR/LastName_FirstName.pdf
 
 Usage:
@@ -23,16 +23,23 @@ Usage:
 
   4. When the browser opens, log in via SSO, navigate to the
      Contacts / Applicants / All list page (search box in top-right),
-     then press Enter in the terminal.
+     then press Enter in the terminal. Applicants are then shared out among
+     WORKERS parallel workers, each with its own browser context sharing the login.
 """
 # Developed with AI assistance (Claude, Anthropic) through iterative
 # debugging. See README for details.
 import asyncio
+import json
 import logging
+import logging.handlers
+import os
 import re
 import sys
-from datetime import datetime
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
+from urllib.parse import parse_qs, quote, quote_plus, urljoin, urlparse
 
 import openpyxl
 from playwright.async_api import async_playwright, TimeoutError as PWTimeout
@@ -44,15 +51,65 @@ EXCEL_PATH     = "applicants_2026.xlsx"          # path to your Excel file, I re
 FIRST_NAME_COL = "First Name"               # exact column header for first name
 LAST_NAME_COL  = "Last Name"                # exact column header for last name
 DOWNLOAD_DIR   = Path("gradcas_downloads")  # folder where PDFs will be saved
+PARTIAL_DIR    = DOWNLOAD_DIR / ".partial"  # in-progress downloads, renamed into DOWNLOAD_DIR when complete
+FORCE_REDOWNLOAD = False                    # True to fetch every applicant again, overwriting existing PDFs
 GRADCAS_URL    = "https://upitt-gradcas.admissionsbyliaison.com/"
+CDP_ENDPOINT   = None     # e.g. "http://localhost:9222" to share an already-running Chromium (see README)
 
-TIMEOUT_MS     = 20_000   # ms to wait for page elements; increase if connection is slow
+STATE_FILE     = Path("gradcas_state.json")  # saved SSO session, reused on re-runs
+STATE_MAX_AGE_HOURS = 8   # log in again once the saved session is older than this
+HEADLESS_WITH_SAVED_SESSION = True  # hide the browser when a saved session is reused
+
+TIMEOUT_MS     = 20_000   # ms to wait for page elements after a navigation; increase if connection is slow
+FAST_TIMEOUT_MS     = 3_000   # ms for clicks on elements a previous step already waited for
+DOWNLOAD_TIMEOUT_MS = 60_000  # ms for fetching/downloading the PDF itself
+FETCH_RETRIES  = 3        # extra attempts for a direct PDF fetch that hits a transient HTTP error
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+WORKERS        = max(4, min(8, os.cpu_count() or 4))  # concurrent workers, each with its own browser context
+PAGE_RECYCLE_EVERY = 25   # replace a worker's page after this many applicants to shed SPA state
+VIEWPORT       = {"width": 1024, "height": 768}
+# Chromium flags that drop the GPU path and background services we never use
+BROWSER_ARGS   = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-features=CalculateNativeWinOcclusion,InterestFeedContentSuggestions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--metrics-recording-only",
+]
+# File types blocked on worker pages (the SSO login window loads everything). Stylesheets
+# stay: they are cached after the first load and the PDF.js viewer needs its own
+BLOCKED_EXTENSIONS = ("png", "jpg", "jpeg", "gif", "svg", "webp", "ico",
+                      "woff", "woff2", "ttf", "otf", "eot", "mp4", "webm")
+# Analytics/tracking hosts blocked on worker pages whatever the file type
+BLOCKED_HOSTS  = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "hotjar.com",
+    "nr-data.net",
+    "segment.io",
+)
 
 # Logging configuration
 # Set to logging.DEBUG for detailed debugging, logging.INFO for normal operation
 LOG_LEVEL      = logging.INFO  # Reduced from DEBUG to reduce log bloat
 LOG_FILE       = "playwright_debug.log"  # Log file name\
 
+########################################################
+# SELECTORS
+########################################################
+SEL_PEOPLE_ICON  = "i[data-name='people']"  # sidebar icon that opens Contacts
+SEL_SEARCH_BTN   = "i.search-button"  # magnifying glass on the list page
+SEL_SEARCH_INPUT = "input[type='text'], input[type='search']"  # search box revealed by SEL_SEARCH_BTN (last match)
+SEL_ROWS         = "tbody tr"  # result / application table rows
+SEL_APPS_TAB     = "a[data-id='tab-applications']"  # Applications link in the profile sidebar
+SEL_APP_LINKS    = "td a, tbody tr a"  # links in the Applications table
+SEL_ATTACHMENTS  = "text=ATTACHMENTS"  # application tab holding the PDF
+SEL_PDF_TOGGLE   = "a[data-id^='toggle-step']"  # APPLICATION PDF section toggle
+SEL_PDF_IFRAME   = "iframe[data-id='PDFViewer'][title$='_application.pdf']"  # PDF.js viewer for the application PDF
+SEL_PDF_DL       = "#downloadButton, button[title='Save'], button[title='Download']"  # PDF.js Save/Download buttons
+
 ########################################################
 # LOGGING SETUP
 ########################################################
@@ -74,13 +131,17 @@ def setup_logging():
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Set levels
-    file_handler.setLevel(logging.DEBUG)  # Always log everything to file
-    console_handler.setLevel(LOG_LEVEL)   # Console level is configurable
+    # Set levels (both follow LOG_LEVEL so INFO runs never build DEBUG records)
+    file_handler.setLevel(LOG_LEVEL)
+    console_handler.setLevel(LOG_LEVEL)
+    
+    # Buffer file writes; the buffer is flushed on ERROR, when full, and at exit
+    buffered_file_handler = logging.handlers.MemoryHandler(capacity=1024, target=file_handler)
+    buffered_file_handler.setLevel(LOG_LEVEL)
     
     # Configure root logger
-    root_logger.setLevel(logging.DEBUG)  # Root must be at lowest level
-    root_logger.addHandler(file_handler)
+    root_logger.setLevel(LOG_LEVEL)
+    root_logger.addHandler(buffered_file_handler)
     root_logger.addHandler(console_handler)
     
     logger = logging.getLogger(__name__)
@@ -91,12 +152,21 @@ logger = setup_logging()
 
 # ------------------------------------------------------------------------------
 
-async def go_back_to_list(page):
+async def go_back_to_list(page, list_page_url=None):
     logger.info(f"🔙 go_back_to_list: Current URL = {page.url}")
+    if list_page_url:
+        # One navigation to the known list URL; a fresh load has no lingering search
+        try:
+            await page.goto(list_page_url, wait_until="domcontentloaded")
+            await wait_for_step(page, SEL_SEARCH_BTN)
+            logger.info(f"  ✅ go_back_to_list complete. New URL = {page.url}")
+            return
+        except PWTimeout:
+            logger.debug("  Direct navigation to the list page timed out, using the sidebar icon...")
     try:
         logger.debug("  Clicking people icon to navigate back...")
-        await page.locator("i[data-name='people']").click(timeout=TIMEOUT_MS)
-        await wait_and_settle(page, ms=2000)
+        await page.locator(SEL_PEOPLE_ICON).click(timeout=TIMEOUT_MS)
+        await wait_for_step(page, SEL_SEARCH_BTN)
         
         # Clear any lingering search by clicking the cancel button
         logger.debug("  Looking for cancel button (X) in search field...")
@@ -119,7 +189,7 @@ async def go_back_to_list(page):
             """)
             if clicked:
                 logger.info("  🖱️  Clicked cancel button to clear search...")
-                await wait_and_settle(page, ms=1000)
+                await wait_for_step(page, SEL_ROWS)
                 logger.info("  ✅ Search cleared")
             else:
                 logger.debug("  No visible cancel button found (search may already be clear)")
@@ -129,99 +199,210 @@ async def go_back_to_list(page):
         logger.info(f"  ✅ go_back_to_list complete. New URL = {page.url}")
     except PWTimeout:
         logger.error("  ❌ Timeout: Could not find people/contacts sidebar icon")
-        print("  Could not find people/contacts sidebar icon")
-def load_applicants(excel_path, first_col, last_col):
-    wb = openpyxl.load_workbook(excel_path)
-    ws = wb.active
-    headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
+def iter_applicants(excel_path, first_col, last_col):
+    """Yield {"first", "last"} for each non-blank row, streaming the sheet."""
+    # read_only streams rows instead of building the whole workbook in memory
+    wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
     try:
-        fi = headers.index(first_col)
-        li = headers.index(last_col)
-    except ValueError as e:
-        sys.exit(f"Column not found in Excel: {e}\nFound columns: {headers}")
+        ws = wb.active
+        # Some exporters write a wrong <dimension>, which read_only mode trusts and
+        # would stop early on; read until the last row actually present instead
+        ws.reset_dimensions()
+        # A StopIteration here would surface as a RuntimeError out of this generator
+        header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
+        if header_row is None:
+            sys.exit(f"No header row found in Excel: {excel_path} is empty")
+        headers = list(header_row)
+        try:
+            fi, li = headers.index(first_col), headers.index(last_col)
+        except ValueError as e:
+            sys.exit(f"Column not found in Excel: {e}\nFound columns: {headers}")
+
+        for row in ws.iter_rows(min_row=2, values_only=True):
+            # Without dimensions, rows stop at their last non-empty cell
+            f = row[fi] if fi < len(row) else None
+            l = row[li] if li < len(row) else None
+            if not f and not l:
+                continue
+            first = (f if isinstance(f, str) else str(f)).strip() if f else ""
+            last  = (l if isinstance(l, str) else str(l)).strip() if l else ""
+            if first or last:
+                yield {"first": first, "last": last}
+    finally:
+        wb.close()  # read_only keeps the zip file open until closed
+
 
+def load_applicants(excel_path, first_col, last_col):
+    # Duplicate rows (case-insensitive) would otherwise run the whole pipeline twice
+    seen = set()
     applicants = []
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        first = str(row[fi]).strip() if row[fi] else ""
-        last  = str(row[li]).strip() if row[li] else ""
-        if first or last:
-            applicants.append({"first": first, "last": last})
+    duplicates = 0
+    for applicant in iter_applicants(excel_path, first_col, last_col):
+        key = (applicant["first"].lower(), applicant["last"].lower())
+        if key in seen:
+            duplicates += 1
+            continue
+        seen.add(key)
+        applicants.append(applicant)
 
-    print(f"Loaded {len(applicants)} applicants from {excel_path}")
+    print(f"Loaded {len(applicants)} applicants from {excel_path}"
+          + (f" ({duplicates} duplicate rows skipped)" if duplicates else ""))
     return applicants
 
 
+_SAFE_RE = re.compile(r'[^\w\-]')
+
+
 def safe_filename(first, last):
-    def clean(s):
-        return re.sub(r'[^\w\-]', '_', s)
-    return f"{clean(last)}_{clean(first)}.pdf"
+    return f"{_SAFE_RE.sub('_', last)}_{_SAFE_RE.sub('_', first)}.pdf"
+
+
+async def wait_for_step(page, selector, state="visible"):
+    """Wait for the DOM to load and for the element the next step needs."""
+    logger.debug("  ⏳ wait_for_step: waiting for %s (%s)...", selector, state)
+    await page.wait_for_load_state("domcontentloaded")
+    await page.locator(selector).first.wait_for(state=state, timeout=TIMEOUT_MS)
+    logger.debug("  ✅ wait_for_step: %s is %s", selector, state)
+
+
+# Lower-cased text of every result row, in the form wait_for_results compares
+ROWS_TEXT_JS = "els => els.map(e => (e.textContent || '').toLowerCase()).join('\\n')"
+
+
+async def type_search(page, last):
+    """Search the list page for last through the search box.
+
+    Returns the result rows' text from before the name was typed, for wait_for_results.
+    """
+    # Click the magnifying glass icon to reveal the search input. click() auto-waits for
+    # it, and the list page may still be loading, so this gets the full budget
+    logger.debug("  Clicking search button once it is visible...")
+    await page.locator(SEL_SEARCH_BTN).click(timeout=TIMEOUT_MS)
+    logger.debug("  Search button clicked")
+    search_input = page.locator(SEL_SEARCH_INPUT).last
+    logger.debug("  Waiting for search input to be visible...")
+    await search_input.wait_for(state="visible", timeout=FAST_TIMEOUT_MS)
+    logger.info("  ✅ Search input is visible")
+    logger.info("  🖱️  Clicking search input...")
+    await search_input.click(timeout=FAST_TIMEOUT_MS)
+    # logger.debug("  Triple-clicking to select all...")
+    # await search_input.triple_click()
+    logger.info(f"  ⌨️  Typing last name: '{last}'")
+    # Snapshot before typing, in case the table filters as the name is entered
+    before = await page.locator(SEL_ROWS).evaluate_all(ROWS_TEXT_JS)
+    await search_input.fill(last)
+    logger.info("  ⌨️  Pressing Enter to submit search...")
+    await search_input.press("Enter")
+    return before
+
 
+async def wait_for_results(page, last, before=None):
+    """Wait until the results table has re-rendered for a search on last.
+
+    before is the rows' text from before the search was submitted, or None after a
+    fresh navigation, where any rows will do. The table before the search can already
+    have rows mentioning last (the unfiltered list, for a short name like "Li"), so the
+    wait is for the rows to change; they then get a short while to all mention last.
+    """
+    js = """([selector, before, last, strict]) => {
+        const texts = Array.from(document.querySelectorAll(selector), e => (e.textContent || '').toLowerCase());
+        const changed = before === null ? texts.length > 0 : texts.join('\\n') !== before;
+        return changed && (!strict || (texts.length > 0 && texts.every(t => t.includes(last))));
+    }"""
+    await page.wait_for_function(js, arg=[SEL_ROWS, before, last.lower(), False], timeout=TIMEOUT_MS)
+    try:
+        await page.wait_for_function(js, arg=[SEL_ROWS, before, last.lower(), True], timeout=FAST_TIMEOUT_MS)
+    except PWTimeout:
+        logger.debug("  Not every result row mentions the last name")
+
+
+def learn_search_url(routes, start_url, url, last):
+    """Record a search URL template if submitting the search put the query into the URL."""
+    if "search_url" in routes or url == start_url:
+        return
+    for token in (quote(last), quote_plus(last), last):
+        if token and token in url and token not in start_url:
+            routes["search_url"] = url.replace(token, "{query}")
+            logger.info(f"  📌 Learned search URL: {routes['search_url']}")
+            return
 
-async def wait_and_settle(page, ms=1500):
-    logger.debug(f"  ⏳ wait_and_settle: waiting {ms}ms...")
-    await page.wait_for_timeout(ms)
-    logger.debug(f"  ✅ wait_and_settle: done ({ms}ms elapsed)")
 
+async def search_and_open_applicant(page, first, last, routes, list_page_url=None):
+    """Search for the applicant and open their profile.
 
-async def search_and_open_applicant(page, first, last):
+    Once a typed search has revealed routes["search_url"], later searches navigate
+    straight to it from wherever page is; routes["search_url"] is None once that has
+    failed, and the search is typed on list_page_url instead. A shortcut search that
+    finds no match is retried by typing, and the shortcut is dropped if typing finds
+    the applicant. The result row click target that worked is kept in
+    routes["row_click"].
+    """
     logger.info(f"🔍 search_and_open_applicant: Searching for '{first} {last}'")
-    logger.debug(f"  Current URL = {page.url}")
+    logger.debug("  Current URL = %s", page.url)
+    start_url = page.url
     try:
-        # Wait for the SPA to fully load â spinner disappears and search icon appears
-        # Wait for the search button to appear (more reliable than networkidle)
-        logger.debug("  Waiting for search button (i.search-button) to be visible...")
-        await page.locator("i.search-button").wait_for(state="visible", timeout=30_000)
-        # Click the magnifying glass icon to reveal the search input
-        await page.locator("i.search-button").click(timeout=TIMEOUT_MS)
-        logger.debug("  Search button clicked, waiting 800ms...")
-        await page.wait_for_timeout(800)
-        search_input = page.locator("input[type='text'], input[type='search']").last
-        input_count = await page.locator("input[type='text'], input[type='search']").count()
-        logger.debug(f"  Found {input_count} search input(s), using last one")
-        logger.debug("  Waiting for search input to be visible...")
-        await search_input.wait_for(state="visible", timeout=TIMEOUT_MS)
-        logger.info("  ✅ Search input is visible")
-        logger.info("  🖱️  Clicking search input...")
-        await search_input.click(timeout=TIMEOUT_MS)
-        # logger.debug("  Triple-clicking to select all...")
-        # await search_input.triple_click()
-        logger.info(f"  ⌨️  Typing last name: '{last}'")
-        await search_input.fill(last)
-        logger.info("  ⌨️  Pressing Enter to submit search...")
-        await search_input.press("Enter")
-        logger.debug("  Waiting 3000ms for search results to update...")
-        await page.wait_for_timeout(3000)
+        template = routes.get("search_url")
+        if template is not None:
+            try:
+                logger.info("  🔗 Opening search results by URL")
+                await page.goto(template.replace("{query}", quote(last)), wait_until="domcontentloaded")
+                await wait_for_results(page, last)
+            except PWTimeout:
+                logger.warning("  ⚠️  Search URL shortcut failed, typing searches from now on")
+                routes["search_url"] = template = None
+                await go_back_to_list(page, list_page_url)
+                start_url = page.url
+        if template is None:
+            before = await type_search(page, last)
+            logger.debug("  Waiting for the results to update...")
+            await wait_for_results(page, last, before)
+            learn_search_url(routes, start_url, page.url, last)
         logger.info("  ✅ Search completed")
     except PWTimeout as e:
         logger.error(f"  ❌ Timeout in search_and_open_applicant: {e}")
-        logger.debug(f"  Current URL = {page.url}")
-        print(f"  Could not find search box")
+        logger.debug("  Current URL = %s", page.url)
         return False
     except Exception as e:
         logger.error(f"  ❌ Unexpected error in search_and_open_applicant: {e}")
-        print(f"  Error searching: {e}")
         return False
 
     logger.debug("  Looking for table rows...")
-    rows = page.locator("tbody tr")
-    count = await rows.count()
+    rows = page.locator(SEL_ROWS)
+    # Match in the page: one round-trip returning two ints instead of every row's text
+    count, match = await rows.evaluate_all("""(els, [first, last]) => {
+        const i = els.findIndex(e => {
+            const t = (e.textContent || '').toLowerCase();
+            return t.includes(first) && t.includes(last);
+        });
+        return [els.length, i];
+    }""", [first.lower(), last.lower()])
     logger.info(f"  Found {count} row(s) in results table")
 
+    if template is not None and (count == 0 or match < 0):
+        # A template that loads but doesn't filter would match against the wrong table
+        logger.warning("  ⚠️  No match through the search URL shortcut, retrying with a typed search")
+        routes["search_url"] = None
+        await go_back_to_list(page, list_page_url)
+        found = await search_and_open_applicant(page, first, last, routes, list_page_url)
+        if found:
+            logger.warning("  ⚠️  Typed search found the applicant, typing searches from now on")
+        elif routes.get("search_url") is None:
+            # Typing missed too, so the applicant is absent rather than the shortcut broken
+            routes["search_url"] = template
+        return found
+
     if count == 0:
         logger.warning(f"  ⚠️  No results for last name '{last}'")
-        print(f"  No results for last name '{last}'")
         return False
 
     target_row = None
-    logger.debug("  Searching for matching row (matching both first and last name)...")
-    for i in range(count):
-        row = rows.nth(i)
-        text = (await row.text_content() or "").strip()
-        logger.debug(f"    Row {i+1}: {text[:100]}...")
-        if first.lower() in text.lower() and last.lower() in text.lower():
-            logger.info(f"  ✅ Found matching row {i+1}")
-            target_row = row
-            break
+    if logger.isEnabledFor(logging.DEBUG):
+        texts = await rows.evaluate_all("els => els.map(e => e.textContent || '')")
+        logger.debug("    Rows: %s", [t.strip()[:60] for t in texts])
+    if match >= 0:
+        logger.info(f"  ✅ Found matching row {match+1} (matching both first and last name)")
+        # Locate by content, not index, so a late re-render of the results can't shift the click
+        target_row = rows.filter(has_text=first).filter(has_text=last).first
 
     if target_row is None:
         if count == 1:
@@ -229,72 +410,102 @@ async def search_and_open_applicant(page, first, last):
             target_row = rows.first
         else:
             logger.warning(f"  ⚠️  '{first} {last}' not uniquely identified among {count} rows")
-            print(f"  '{first} {last}' not uniquely identified among {count} rows")
             return False
 
-    try:
-        logger.info("  🖱️  Clicking on target row (last td)...")
-        await target_row.locator("td").last.click(timeout=8000)
-        logger.info("  ✅ Row clicked successfully")
-    except PWTimeout:
-        logger.debug("  Last td click failed, trying to click entire row...")
-        await target_row.click(timeout=8000)
-        logger.info("  ✅ Row clicked successfully (fallback)")
+    # routes["row_click"] remembers the target that last opened a profile, so later
+    # applicants skip a known miss; it is recorded only once the profile has loaded
+    targets = ["row", "last_td"] if routes.get("row_click") == "row" else ["last_td", "row"]
+    for target in targets:
+        try:
+            if target == "last_td":
+                logger.info("  🖱️  Clicking on target row (last td)...")
+                await target_row.locator("td").last.click(timeout=FAST_TIMEOUT_MS)
+            else:
+                logger.info("  🖱️  Clicking on target row (whole row)...")
+                await target_row.click(timeout=FAST_TIMEOUT_MS)
+            logger.debug("  Waiting for the applicant profile to load...")
+            await wait_for_step(page, SEL_APPS_TAB)
+        except PWTimeout:
+            logger.debug(f"  Clicking the {target} did not open the profile")
+            if routes.get("row_click") == target:
+                del routes["row_click"]
+            continue
+        routes["row_click"] = target
+        logger.info(f"  ✅ Navigation complete. New URL = {page.url}")
+        return True
 
-    logger.debug("  Waiting for page to settle after row click...")
-    await wait_and_settle(page)
-    logger.info(f"  ✅ Navigation complete. New URL = {page.url}")
-    return True
+    logger.error("  ❌ Timeout: applicant profile did not load")
+    return False
 
 
 async def click_applications_sidebar(page):
     logger.info("📋 click_applications_sidebar")
-    logger.debug(f"  Current URL = {page.url}")
+    logger.debug("  Current URL = %s", page.url)
     try:
-        logger.debug("  Looking for Applications sidebar link: a[data-id='tab-applications']")
-        await page.locator("a[data-id='tab-applications']").click(timeout=TIMEOUT_MS)
+        logger.debug(f"  Looking for Applications sidebar link: {SEL_APPS_TAB}")
+        await page.locator(SEL_APPS_TAB).click(timeout=FAST_TIMEOUT_MS)
         logger.info("  ✅ Click successful")
-        await wait_and_settle(page, ms=2000)
+        await wait_for_step(page, SEL_ROWS)
         logger.info(f"  ✅ Navigation complete. New URL = {page.url}")
         return True
     except PWTimeout as e:
         logger.error(f"  ❌ Timeout: Could not find 'Applications' sidebar link: {e}")
-        print("  Could not find 'Applications' sidebar link")
         return False
     except Exception as e:
         logger.error(f"  ❌ Error in click_applications_sidebar: {e}")
         return False
 
 
+async def open_applications_list(page, routes):
+    """Open the profile's Applications list, by URL once a click has revealed the route.
+
+    routes is shared by all workers; "applications_suffix" maps a profile URL to its
+    Applications list URL, or is None once a direct navigation has failed.
+    """
+    profile_url = page.url
+    suffix = routes.get("applications_suffix")
+    if suffix is not None:
+        logger.info("📋 open_applications_list: navigating directly")
+        try:
+            await page.goto(profile_url + suffix, wait_until="domcontentloaded")
+            await wait_for_step(page, SEL_ROWS)
+            logger.info(f"  ✅ Navigation complete. New URL = {page.url}")
+            return True
+        except PWTimeout:
+            logger.warning("  ⚠️  Applications URL shortcut failed, using the sidebar from now on")
+            routes["applications_suffix"] = None
+            await page.goto(profile_url, wait_until="domcontentloaded")
+            await wait_for_step(page, SEL_APPS_TAB)
+
+    if not await click_applications_sidebar(page):
+        return False
+    if "applications_suffix" not in routes and page.url.startswith(profile_url) and page.url != profile_url:
+        routes["applications_suffix"] = page.url[len(profile_url):]
+        logger.info(f"  📌 Learned Applications route: <profile URL>{routes['applications_suffix']}")
+    return True
+
+
 async def click_application_row(page):
     logger.info("📄 click_application_row")
-    logger.debug(f"  Current URL = {page.url}")
+    logger.debug("  Current URL = %s", page.url)
     try:
-        logger.debug("  Looking for application link (td a, tbody tr a)...")
-        app_link = page.locator("td a, tbody tr a").first
-        count = await page.locator("td a, tbody tr a").count()
-        logger.debug(f"  Found {count} application link(s)")
-        
-        logger.info("  🖱️  Clicking first application link...")
-        await app_link.click(timeout=TIMEOUT_MS)
+        # Wait for the link itself: any table on the profile satisfies the earlier row
+        # wait, and the Applications table can render after it
+        link = page.locator(SEL_APP_LINKS).first
+        try:
+            await link.wait_for(state="visible", timeout=TIMEOUT_MS)
+            logger.info("  🖱️  Clicking first application link...")
+            await link.click(timeout=FAST_TIMEOUT_MS)
+        except PWTimeout:
+            logger.info("  🖱️  No application link, clicking last td of first row...")
+            await page.locator(SEL_ROWS).first.locator("td").last.click(timeout=FAST_TIMEOUT_MS)
         logger.info("  ✅ Click successful")
-        await wait_and_settle(page)
+        await wait_for_step(page, SEL_ATTACHMENTS)
         logger.info(f"  ✅ Navigation complete. New URL = {page.url}")
         return True
-    except PWTimeout:
-        logger.debug("  First method failed, trying fallback (click last td of first row)...")
-        try:
-            first_row = page.locator("tbody tr").first
-            logger.info("  🖱️  Clicking last td of first row (fallback)...")
-            await first_row.locator("td").last.click(timeout=8000)
-            logger.info("  ✅ Click successful (fallback)")
-            await wait_and_settle(page)
-            logger.info(f"  ✅ Navigation complete. New URL = {page.url}")
-            return True
-        except PWTimeout as e:
-            logger.error(f"  ❌ Could not click into application row: {e}")
-            print("  Could not click into application row")
-            return False
+    except PWTimeout as e:
+        logger.error(f"  ❌ Could not click into application row: {e}")
+        return False
     except Exception as e:
         logger.error(f"  ❌ Error in click_application_row: {e}")
         return False
@@ -302,11 +513,11 @@ async def click_application_row(page):
 
 async def click_attachments_tab(page):
     try:
-        await page.locator("text=ATTACHMENTS").click(timeout=TIMEOUT_MS)
-        await wait_and_settle(page, ms=2000)
+        await page.locator(SEL_ATTACHMENTS).click(timeout=FAST_TIMEOUT_MS)
+        await wait_for_step(page, SEL_PDF_TOGGLE, state="attached")
         return True
     except PWTimeout:
-        print("  Could not find ATTACHMENTS tab")
+        logger.error("  ❌ Timeout: Could not find ATTACHMENTS tab")
         return False
 
 
@@ -314,185 +525,519 @@ async def expand_application_pdf(page):
     logger.info("📄 expand_application_pdf")
     try:
         # Check if the iframe is already visible (section already expanded)
-        iframe_locator = page.locator("iframe[data-id='PDFViewer'][title$='_application.pdf']")
+        iframe_locator = page.locator(SEL_PDF_IFRAME)
         already_visible = await iframe_locator.count()
         
         if already_visible == 0:
             logger.debug("  iframe not found, clicking toggle to expand...")
-            await page.locator("a[data-id^='toggle-step']").first.click(timeout=TIMEOUT_MS)
-            await wait_and_settle(page, ms=1000)
+            await page.locator(SEL_PDF_TOGGLE).first.click(timeout=FAST_TIMEOUT_MS)
         else:
             logger.info("  ✅ Application PDF already expanded, skipping toggle click")
 
-        # Wait for iframe to be attached and loaded
+        # Wait for iframe to be attached; the PDF itself is picked up from its network response
         await iframe_locator.wait_for(state="attached", timeout=TIMEOUT_MS)
-        logger.info("  ✅ Application PDF iframe is ready")
-        await wait_and_settle(page, ms=3000)
+        logger.info("  ✅ Application PDF iframe is attached")
         return True
     except PWTimeout as e:
         logger.error(f"  ❌ Timeout in expand_application_pdf: {e}")
-        print("  Could not expand Application PDF or find PDF viewer iframe")
         return False
     except Exception as e:
         logger.error(f"  ❌ Error in expand_application_pdf: {e}")
         return False
 
 
-async def download_pdf(page, download_dir, filename):
+def is_pdf_response(response):
+    return "pdf" in response.headers.get("content-type", "").lower()
+
+
+def response_frame(response):
+    try:
+        return response.frame
+    except Exception:
+        return None  # service worker responses have no frame
+
+
+@contextmanager
+def watch_pdf_responses(page):
+    """Collect (url, frame) for each PDF response loaded by page (including the PDF.js iframes)."""
+    pdf_responses = []
+
+    def record(response):
+        if is_pdf_response(response):
+            pdf_responses.append((response.url, response_frame(response)))
+
+    page.on("response", record)
+    try:
+        yield pdf_responses
+    finally:
+        # Worker pages are reused, so don't leave a listener behind per applicant
+        page.remove_listener("response", record)
+
+
+async def application_pdf_frame(page):
+    """Return the frame of the application PDF viewer iframe, or None."""
+    handle = await page.locator(SEL_PDF_IFRAME).first.element_handle(timeout=FAST_TIMEOUT_MS)
+    return await handle.content_frame()
+
+
+async def pdf_url_from_iframe(page):
+    """Return the PDF URL the viewer iframe points at (PDF.js viewer.html?file=...), or None."""
+    src = await page.locator(SEL_PDF_IFRAME).first.get_attribute(
+        "src", timeout=FAST_TIMEOUT_MS)
+    if not src:
+        return None
+    src = urljoin(page.url, src)
+    parsed = urlparse(src)
+    file_param = parse_qs(parsed.query).get("file")
+    if file_param:
+        return urljoin(src, file_param[0])
+    if parsed.path.lower().endswith(".pdf"):
+        return src
+    return None
+
+
+async def fetch_pdf(page, pdf_url, dest):
+    """GET pdf_url with the page's session cookies and write it to dest, bypassing the viewer."""
+    logger.debug("  Fetching PDF directly: %s", pdf_url)
+    # The context's request client is shared by every applicant a worker handles, so its
+    # keep-alive connections to the file host are reused; only transient errors are retried
+    for attempt in range(FETCH_RETRIES + 1):
+        response = await page.context.request.get(pdf_url, timeout=DOWNLOAD_TIMEOUT_MS)
+        if response.status not in RETRY_STATUSES or attempt == FETCH_RETRIES:
+            break
+        await response.dispose()
+        delay = 0.5 * 2 ** attempt
+        logger.info(f"  🔁 PDF fetch returned HTTP {response.status}, retrying in {delay}s")
+        await asyncio.sleep(delay)
+    try:
+        if not response.ok:
+            logger.warning(f"  ⚠️  Direct PDF fetch returned HTTP {response.status}")
+            return False
+        body = await response.body()
+        # An expired session answers 200 with the SSO page; never save that as the PDF
+        if b"%PDF-" not in body[:1024]:
+            logger.warning(f"  ⚠️  Direct PDF fetch returned {response.headers.get('content-type', 'unknown content')}, not a PDF")
+            return False
+        # Write beside the real name and rename, so an interrupted write never leaves a
+        # truncated PDF that later runs would skip as already downloaded
+        part = PARTIAL_DIR / dest.name
+        part.write_bytes(body)
+        os.replace(part, dest)
+        return True
+    finally:
+        # The driver keeps every response body until disposed (or the context closes,
+        # which for a long-lived worker context is the end of the run)
+        await response.dispose()
+
+
+async def download_pdf(page, download_dir, filename, pdf_responses=()):
     dest = download_dir / filename
+
+    # Preferred path: fetch the PDF the viewer loaded instead of driving the PDF.js UI.
+    # The application iframe's src names its PDF, so it comes before anything sniffed
+    pdf_url = None
     try:
-        async with page.expect_download(timeout=30_000) as dl_info:
-            try:
-                # Use the iframe with title ending in "_application.pdf"
-                frame = page.frame_locator("iframe[data-id='PDFViewer'][title$='_application.pdf']").first
-                await frame.locator("#downloadButton").click(timeout=10_000)
-            except Exception:
-                try:
-                    frame = page.frame_locator("iframe[data-id='PDFViewer'][title$='_application.pdf']").first
-                    await frame.locator("button[title='Save'], button[title='Download']").first.click(timeout=8000)
-                except Exception:
-                    await page.locator("button:has-text('Save'), button:has-text('Download')").first.click(timeout=8000)
+        pdf_url = await pdf_url_from_iframe(page)
+    except Exception as e:
+        logger.debug(f"  Could not read the viewer iframe src: {e}")
+    app_frame = None
+    if pdf_url is None:
+        # Only the application viewer's own loads count; other attachment viewers load PDFs too
+        try:
+            app_frame = await application_pdf_frame(page)
+        except Exception as e:
+            logger.debug(f"  Could not find the application viewer frame: {e}")
+        app_urls = [url for url, frame in pdf_responses if app_frame is not None and frame is app_frame]
+        pdf_url = app_urls[-1] if app_urls else None
+    if pdf_url is None and app_frame is not None:
+        try:
+            response = await page.wait_for_event(
+                "response",
+                predicate=lambda r: is_pdf_response(r) and response_frame(r) is app_frame,
+                timeout=TIMEOUT_MS)
+            pdf_url = response.url
+        except PWTimeout:
+            logger.debug("  No PDF response seen, falling back to the viewer's download button")
+    if pdf_url is not None:
+        try:
+            if await fetch_pdf(page, pdf_url, dest):
+                size_kb = dest.stat().st_size // 1024
+                logger.info(f"  💾 Saved: {dest.name}  ({size_kb} KB)")
+                return True
+        except Exception as e:
+            logger.warning(f"  ⚠️  Direct PDF fetch failed, falling back to the viewer: {e}")
+
+    try:
+        # Use the iframe with title ending in "_application.pdf"; one selector covers
+        # every PDF.js toolbar variant so a miss costs one short timeout, not three
+        frame  = page.frame_locator(SEL_PDF_IFRAME).first
+        dl_btn = frame.locator(SEL_PDF_DL).first
+        # Wait for PDF.js to show its toolbar before arming expect_download, so the
+        # click never races the viewer's startup
+        await dl_btn.wait_for(state="visible", timeout=TIMEOUT_MS)
+        async with page.expect_download(timeout=DOWNLOAD_TIMEOUT_MS) as dl_info:
+            await dl_btn.click(timeout=FAST_TIMEOUT_MS)
 
         download = await dl_info.value
-        await download.save_as(dest)
+        try:
+            # Temp downloads land in PARTIAL_DIR (downloads_path), on the same filesystem
+            # as DOWNLOAD_DIR, so this is a rename, not a copy
+            os.replace(await download.path(), dest)
+        except Exception as e:
+            logger.debug(f"  Could not move temp download into place ({e}), copying instead")
+            await download.save_as(dest)
         size_kb = dest.stat().st_size // 1024
-        print(f"  Saved: {dest.name}  ({size_kb} KB)")
+        logger.info(f"  💾 Saved: {dest.name}  ({size_kb} KB)")
         return True
 
     except Exception as e:
-        print(f"  Download failed: {e}")
+        logger.error(f"  ❌ Download failed: {e}")
         return False
 
 
-async def main():
-    DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
-    applicants = load_applicants(EXCEL_PATH, FIRST_NAME_COL, LAST_NAME_COL)
+async def process_applicant(page, first, last, fname, routes, list_page_url=None):
+    """Run the search -> download sequence on page. Returns None on success, else a failure reason."""
+    if not await search_and_open_applicant(page, first, last, routes, list_page_url):
+        return "not found"
 
-    succeeded = []
-    failed    = []
+    if not await open_applications_list(page, routes):
+        return "Applications sidebar missing"
 
-    async with async_playwright() as pw:
-        browser = await pw.chromium.launch(headless=False)
-        context = await browser.new_context(
-            accept_downloads=True,
-            viewport={"width": 1400, "height": 900},
-        )
-        page = await context.new_page()
-        
-        # Set up event listeners for detailed logging
-        def log_click(event):
-            # Event handlers must be synchronous, so we just log coordinates
-            try:
-                logger.debug(f"🖱️  MOUSE CLICK: at ({event.x}, {event.y})")
-            except Exception as e:
-                logger.debug(f"Error logging click: {e}")
-        
-        def log_navigation(event):
-            try:
-                logger.info(f"🌐 NAVIGATION: {event.url}")
-            except Exception as e:
-                logger.debug(f"Error logging navigation: {e}")
-        
-        def log_console(msg):
-            try:
-                logger.debug(f"📝 CONSOLE: {msg.text}")
-            except Exception as e:
-                logger.debug(f"Error logging console: {e}")
-        
-        page.on("click", log_click)
-        page.on("framenavigated", log_navigation)
-        page.on("console", log_console)
-        
+    if not await click_application_row(page):
+        return "could not open application"
+
+    # Start listening before the viewer can request the PDF
+    with watch_pdf_responses(page) as pdf_responses:
+        if not await click_attachments_tab(page):
+            return "ATTACHMENTS tab missing"
+
+        if not await expand_application_pdf(page):
+            return "APPLICATION PDF section missing"
+
+        if not await download_pdf(page, DOWNLOAD_DIR, fname, pdf_responses):
+            return "download failed"
+    return None
+
+
+def blocked_url_patterns():
+    patterns = []
+    for ext in BLOCKED_EXTENSIONS:
+        patterns += [f"*.{ext}", f"*.{ext}?*"]
+    for host in BLOCKED_HOSTS:
+        patterns += [f"*://{host}/*", f"*.{host}/*"]
+    return patterns
+
+
+async def block_unneeded_resources(page):
+    """Block assets the pipeline never looks at on page.
+
+    Chromium matches the patterns itself, so unlike context.route() no request waits on
+    a Python round-trip and the HTTP cache stays on for the SPA's scripts. The price is
+    that Network.enable makes the driver forward every Network.* event for the page to
+    this CDP session; those are fire-and-forget messages, but they are per-request IPC.
+    """
+    cdp = await page.context.new_cdp_session(page)
+    await cdp.send("Network.enable")
+    await cdp.send("Network.setBlockedURLs", {"urls": blocked_url_patterns()})
+
+
+def attach_debug_listeners(page):
+    # Every listener makes the driver forward each matching event to Python,
+    # which chatty SPA pages turn into a steady stream; only pay for it when debugging
+    if LOG_LEVEL > logging.DEBUG:
+        return
+
+    # Set up event listeners for detailed logging
+    def log_click(event):
+        # Event handlers must be synchronous, so we just log coordinates
         try:
-            logger.info(f"🚀 Navigating to {GRADCAS_URL}")
-            await page.goto(GRADCAS_URL)
-            logger.info(f"✅ Initial page loaded. URL = {page.url}")
+            logger.debug(f"🖱️  MOUSE CLICK: at ({event.x}, {event.y})")
         except Exception as e:
-            logger.error(f"❌ Error navigating to initial page: {e}")
-            print(f"Error loading page: {e}")
-            print("Browser will remain open. Please navigate manually.")
-
-        print("\n" + "="*60)
-        print("Browser is open. Please:")
-        print("  1. Log in via Pitt SSO")
-        print("  2. Navigate to: Contacts > Applicants > All")
-        print("     (the list page with the search box in the top-right)")
-        print("  3. Return here and press Enter")
-        print("="*60 + "\n")
-        
+            logger.debug(f"Error logging click: {e}")
+
+    def log_navigation(event):
         try:
-            input("Press Enter when ready > ")
-        except (EOFError, KeyboardInterrupt) as e:
-            logger.warning(f"Input interrupted: {e}")
-            print("\n⚠️  Input was interrupted. Browser will remain open.")
-            print("You can close it manually when done.")
-            return
+            logger.info(f"🌐 NAVIGATION: {event.url}")
+        except Exception as e:
+            logger.debug(f"Error logging navigation: {e}")
 
+    def log_console(msg):
         try:
-            list_page_url = page.url
-            logger.info(f"📌 List page URL saved: {list_page_url}")
-            page_title = await page.title()
-            logger.info(f"📌 Current page title: {page_title}")
+            logger.debug(f"📝 CONSOLE: {msg.text}")
         except Exception as e:
-            logger.error(f"❌ Error getting page info: {e}")
-            print(f"Warning: Could not get page info: {e}")
-            list_page_url = page.url  # Fallback to current URL
-
-        for i, applicant in enumerate(applicants, 1):
-            first = applicant["first"]
-            last  = applicant["last"]
-            fname = safe_filename(first, last)
-            dest  = DOWNLOAD_DIR / fname
-
-            print(f"\n[{i}/{len(applicants)}] {first} {last}")
-
-            # Check if file already exists and has content (not corrupted/incomplete)
-            if dest.exists():
-                file_size = dest.stat().st_size
-                if file_size > 0:
-                    size_kb = file_size // 1024
-                    print(f"  ✅ Already downloaded ({size_kb} KB), skipping")
-                    logger.info(f"  Skipping {fname} - already exists ({size_kb} KB)")
-                    succeeded.append(f"{first} {last}")
-                    continue
-                else:
-                    # File exists but is empty/corrupted, remove it and re-download
-                    print(f"  ⚠️  File exists but is empty/corrupted, will re-download")
-                    logger.warning(f"  File {fname} exists but is 0 bytes, removing for re-download")
-                    dest.unlink()
+            logger.debug(f"Error logging console: {e}")
 
-            try:
-                logger.info("="*60)
-                logger.info(f"Starting processing for: {first} {last}")
-                logger.info("="*60)
-                
-                await go_back_to_list(page)
+    page.on("click", log_click)
+    page.on("framenavigated", log_navigation)
+    page.on("console", log_console)
+
+
+async def open_browser(pw, headless=False):
+    if CDP_ENDPOINT:
+        # Reuse one long-lived browser across runs/processes; each run only adds contexts
+        logger.info(f"🔌 Connecting to shared browser at {CDP_ENDPOINT}")
+        return await pw.chromium.connect_over_cdp(CDP_ENDPOINT)
+    return await pw.chromium.launch(
+        headless=headless,
+        args=BROWSER_ARGS,
+        downloads_path=str(PARTIAL_DIR),
+    )
 
-                if not await search_and_open_applicant(page, first, last):
-                    failed.append(f"{first} {last} - not found"); continue
 
-                if not await click_applications_sidebar(page):
-                    failed.append(f"{first} {last} - Applications sidebar missing"); continue
+def load_saved_session():
+    """Return (storage_state, list_page_url) from STATE_FILE if it is recent enough, else None."""
+    if not STATE_FILE.exists():
+        return None
+    age = datetime.now() - datetime.fromtimestamp(STATE_FILE.stat().st_mtime)
+    if age > timedelta(hours=STATE_MAX_AGE_HOURS):
+        logger.info(f"🔑 Saved session in {STATE_FILE} is {age} old, ignoring it")
+        return None
+    try:
+        saved = json.loads(STATE_FILE.read_text())
+        return saved["storage_state"], saved["list_page_url"]
+    except (ValueError, KeyError) as e:
+        logger.warning(f"⚠️  Could not read saved session {STATE_FILE}: {e}")
+        return None
+
 
-                if not await click_application_row(page):
-                    failed.append(f"{first} {last} - could not open application"); continue
+def save_session(state, list_page_url):
+    # Holds live session cookies, so create it owner-only rather than chmod it afterwards
+    fd = os.open(STATE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.fchmod(fd, 0o600)  # the mode above only applies to a newly created file
+    with os.fdopen(fd, "w") as f:
+        json.dump({"list_page_url": list_page_url, "storage_state": state}, f)
+    logger.info(f"🔑 Session saved to {STATE_FILE}")
 
-                if not await click_attachments_tab(page):
-                    failed.append(f"{first} {last} - ATTACHMENTS tab missing"); continue
 
-                if not await expand_application_pdf(page):
-                    failed.append(f"{first} {last} - APPLICATION PDF section missing"); continue
+async def session_is_valid(browser, state, list_page_url):
+    """Open the list page with a saved session; False if it no longer gets past SSO."""
+    ctx = await browser.new_context(storage_state=state, viewport=VIEWPORT)
+    try:
+        page = await ctx.new_page()
+        await page.goto(list_page_url)
+        await page.locator(SEL_SEARCH_BTN).wait_for(state="visible", timeout=TIMEOUT_MS)
+        logger.info(f"🔑 Reusing saved session from {STATE_FILE}")
+        return True
+    except Exception as e:
+        logger.info(f"🔑 Saved session rejected ({e}), falling back to interactive login")
+        return False
+    finally:
+        await ctx.close()
 
-                if await download_pdf(page, DOWNLOAD_DIR, fname):
-                    succeeded.append(f"{first} {last}")
-                else:
-                    failed.append(f"{first} {last} - download failed")
 
-            except Exception as e:
-                print(f"  Unexpected error: {e}")
-                failed.append(f"{first} {last} - error: {e}")
+async def read_line(prompt):
+    """input() without blocking the event loop.
+
+    Unlike asyncio.to_thread, the reading thread is a daemon, so an interrupted prompt
+    doesn't keep the process alive until Enter is pressed. It reads the raw descriptor:
+    a daemon thread parked inside sys.stdin's buffer aborts interpreter shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(set_result, value):
+        if not future.done():
+            set_result(value)
+
+    def read():
+        try:
+            data = os.read(sys.stdin.fileno(), 4096)
+            if not data:
+                raise EOFError("EOF when reading a line")
+        except Exception as e:
+            loop.call_soon_threadsafe(settle, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(settle, future.set_result, data.decode(errors="replace").rstrip("\r\n"))
+
+    print(prompt, end="", flush=True)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+async def interactive_login(browser):
+    """Let the user log in via SSO. Returns (storage_state, list_page_url), or None if interrupted."""
+    context = await browser.new_context(
+        accept_downloads=True,
+        viewport=VIEWPORT,
+    )
+    page = await context.new_page()
+    attach_debug_listeners(page)
+
+    try:
+        logger.info(f"🚀 Navigating to {GRADCAS_URL}")
+        await page.goto(GRADCAS_URL)
+        logger.info(f"✅ Initial page loaded. URL = {page.url}")
+    except Exception as e:
+        logger.error(f"❌ Error navigating to initial page: {e}")
+        print(f"Error loading page: {e}")
+        print("Browser will remain open. Please navigate manually.")
+
+    print("\n" + "="*60)
+    print("Browser is open. Please:")
+    print("  1. Log in via Pitt SSO")
+    print("  2. Navigate to: Contacts > Applicants > All")
+    print("     (the list page with the search box in the top-right)")
+    print("  3. Return here and press Enter")
+    print("="*60 + "\n")
+
+    try:
+        # Read in a thread so the event loop keeps servicing the browser during SSO
+        await read_line("Press Enter when ready > ")
+    except (EOFError, KeyboardInterrupt, asyncio.CancelledError) as e:
+        # Ctrl+C reaches us as the cancellation asyncio.run sends the main task
+        logger.warning(f"Input interrupted: {e}")
+        print("\n⚠️  Input was interrupted. Browser will remain open.")
+        print("You can close it manually when done.")
+        return None
+
+    try:
+        list_page_url = page.url
+        logger.info(f"📌 List page URL saved: {list_page_url}")
+        page_title = await page.title()
+        logger.info(f"📌 Current page title: {page_title}")
+    except Exception as e:
+        logger.error(f"❌ Error getting page info: {e}")
+        print(f"Warning: Could not get page info: {e}")
+        list_page_url = page.url  # Fallback to current URL
+
+    # Share the SSO session with the worker contexts, then drop the login context
+    state = await context.storage_state()
+    await context.close()
+    return state, list_page_url
+
+
+async def process_pending(pending, total):
+    """Log in and download every (index, applicant) in pending. Returns (succeeded, failed), or None if interrupted."""
+    succeeded = []
+    failed    = []
+
+    async with async_playwright() as pw:
+        session = load_saved_session()
+        # Nobody needs to see the browser when the saved session spares the SSO step
+        browser = await open_browser(pw, headless=session is not None and HEADLESS_WITH_SAVED_SESSION)
+        if session is not None and not await session_is_valid(browser, *session):
+            session = None
+            if HEADLESS_WITH_SAVED_SESSION and not CDP_ENDPOINT:
+                await browser.close()
+                browser = await open_browser(pw, headless=False)
+        if session is None:
+            session = await interactive_login(browser)
+            if session is None:
+                return None
+            save_session(*session)
+        state, list_page_url = session
+
+        routes = {}  # URL shortcuts learned from the first applicants, see open_applications_list
+        queue  = asyncio.Queue()
+        for item in pending:
+            queue.put_nowait(item)
+
+        async def worker():
+            """Process applicants from the queue on one long-lived context, recording each in succeeded/failed."""
+            ctx = await browser.new_context(
+                accept_downloads=True,
+                storage_state=state,
+                viewport=VIEWPORT,
+            )
+            try:
+                page = await ctx.new_page()
+                await block_unneeded_resources(page)
+                attach_debug_listeners(page)
+                handled = 0
+
+                while not queue.empty():
+                    i, applicant = queue.get_nowait()
+                    first = applicant["first"]
+                    last  = applicant["last"]
+                    name  = f"{first} {last}"
+                    fname = safe_filename(first, last)
+
+                    try:
+                        if handled and handled % PAGE_RECYCLE_EVERY == 0:
+                            # The session lives on the context, so a fresh page stays logged in
+                            logger.info(f"♻️  Recycling worker page after {handled} applicants")
+                            await page.close()
+                            page = await ctx.new_page()
+                            await block_unneeded_resources(page)
+                            attach_debug_listeners(page)
+                        handled += 1
+                        logger.info("="*60)
+                        logger.info(f"[{i}/{total}] Starting processing for: {name}")
+                        logger.info("="*60)
+
+                        # A learned search URL is a navigation of its own; going back to the
+                        # list first would load the SPA twice per applicant
+                        if page.url != list_page_url and routes.get("search_url") is None:
+                            await go_back_to_list(page, list_page_url)
+                        reason = await process_applicant(page, first, last, fname, routes, list_page_url)
+                    except Exception as e:
+                        logger.error(f"  ❌ Unexpected error for {name}: {e}")
+                        reason = f"error: {e}"
+
+                    if reason is None:
+                        succeeded.append(name)
+                    else:
+                        failed.append(f"{name} - {reason}")
+            finally:
+                await ctx.close()
+
+        n_workers = min(WORKERS, len(pending))
+        logger.info(f"👥 Processing {len(pending)} applicants with {n_workers} concurrent contexts")
+        # One worker failing to set up must not lose the others' results or the summary
+        results = await asyncio.gather(*(worker() for _ in range(n_workers)), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"  ❌ Worker stopped: {result}")
+        # Left in the queue only if every worker stopped early
+        while not queue.empty():
+            i, applicant = queue.get_nowait()
+            failed.append(f"{applicant['first']} {applicant['last']} - worker stopped")
 
         await browser.close()
+    return succeeded, failed
+
+
+def existing_downloads(download_dir):
+    """Map each PDF already in download_dir to its size, from a single directory scan."""
+    with os.scandir(download_dir) as entries:
+        return {e.name: e.stat().st_size for e in entries if e.name.endswith(".pdf") and e.is_file()}
+
+
+async def main():
+    DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    PARTIAL_DIR.mkdir(exist_ok=True)
+    applicants = load_applicants(EXCEL_PATH, FIRST_NAME_COL, LAST_NAME_COL)
+
+    succeeded = []
+    failed    = []
+
+    # Sort out already-downloaded applicants before any browser work
+    existing = {} if FORCE_REDOWNLOAD else existing_downloads(DOWNLOAD_DIR)
+    total    = len(applicants)
+    pending  = []
+    for i, applicant in enumerate(applicants, 1):
+        name  = f"{applicant['first']} {applicant['last']}"
+        fname = safe_filename(applicant["first"], applicant["last"])
+        size  = existing.get(fname)
+        # Check if file already exists and has content (not corrupted/incomplete)
+        if size:
+            size_kb = size // 1024
+            logger.info(f"[{i}/{total}] {name}: ✅ Already downloaded as {fname} ({size_kb} KB), skipping")
+            succeeded.append(name)
+            continue
+        if size == 0:
+            # File exists but is empty/corrupted, remove it and re-download
+            logger.warning(f"[{i}/{total}] {name}: ⚠️  {fname} exists but is 0 bytes, removing for re-download")
+            (DOWNLOAD_DIR / fname).unlink()
+        pending.append((i, applicant))
+
+    if pending:
+        results = await process_pending(pending, total)
+        if results is None:
+            return
+        succeeded.extend(results[0])
+        failed.extend(results[1])
 
     print("\n" + "="*60)
     print(f"COMPLETE: {len(succeeded)} succeeded, {len(failed)} failed")